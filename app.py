@@ -1,22 +1,21 @@
 import logging
-import logging.config
-from pathlib import Path
 from importlib import import_module
 
 from nicegui import ui, app
 
-from src.config import load_config
+from src.config import load_config, setup_logging
 from src.frontend.dashboard import get_fig
 from src.frontend import deps #initialize startup/shutdow hooks
 from src.scheduler import IrrigationScheduler
 
 config = load_config('config/config.yaml')
-logging.config.dictConfig(config['logging'])
+setup_logging(config['logging'])
 
-for path in Path('src/frontend').glob('*.py'):
-    if path.stem.startswith('_') or path.stem in {'__init__'}:
-        continue
-    import_module(f'src.frontend.{path.stem}')
+# Modules registering @ui.page routes. Add new pages here.
+FRONTEND_PAGES = ('dashboard', 'fields', 'irrigation')
+
+for page in FRONTEND_PAGES:
+    import_module(f'src.frontend.{page}')
 
 # 1. Define the callback (wrapped to ensure force=True)
 async def scheduled_refresh():
@@ -1,9 +1,8 @@
 #Example for base app classes structure: https://github.com/kthorp/pyfao56/blob/main/tests/test01/cottondry2013.py
 import logging
-import logging.config
 from datetime import datetime
 
-from src.config import load_config
+from src.config import load_config, setup_logging
 from src.database.db import IrrigDB
 from src.workflow import WaterBalanceWorkflow
 
@@ -13,7 +12,7 @@ logger = logging.getLogger(__name__)
 if __name__ == "__main__":
     
     config = load_config('config/config.yaml')
-    logging.config.dictConfig(config['logging'])
+    setup_logging(config['logging'])
 
     logger.info("#"*50)
     logger.info('Starting water balance calculation')
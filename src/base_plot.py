@@ -1,12 +1,23 @@
 # plotting/base_plot.py
+from functools import lru_cache
 from typing import Iterable, Optional, Sequence, Union
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.basedatatypes import BaseTraceType
 from plotly.subplots import make_subplots
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Encode figures with orjson (installed with nicegui), which serializes numpy arrays in C
+try:
+    import orjson  # noqa: F401
+    pio.json.config.default_engine = "orjson"
+except ImportError:
+    logger.debug("orjson not available; plotly uses the default JSON encoder.")
+
 Number = Union[int, float]
 
 class BasePlot:
@@ -39,6 +50,57 @@ class BasePlot:
         ]
         # Keep track of colors actually used so marker overlays can match line colors
         self._trace_colors: dict[str, str] = {}
+        # Traces collected with defer=True, added to the figure in one call by flush()
+        self._pending: list[tuple[BaseTraceType, int]] = []
+
+    def _require_fig(self) -> go.Figure:
+        """Return the figure, raising if create_base() has not been called yet."""
+        fig = self.fig
+        if fig is None:
+            raise ValueError("Figure not initialized. Call create_base() before plotting.")
+        return fig
+
+    def _add_trace(self, fig: go.Figure, trace: BaseTraceType, row: int, defer: bool) -> None:
+        if defer:
+            self._pending.append((trace, row))
+        else:
+            fig.add_trace(trace, row=row, col=1)
+
+    def _next_color(self, fig: go.Figure) -> str:
+        # mimic Plotly's colorway assignment, counting traces that are still pending
+        return self.colorway[(len(fig.data) + len(self._pending)) % len(self.colorway)]
+
+    def flush(self) -> "BasePlot":
+        """
+        Add all traces collected with defer=True to the figure in a single add_traces call.
+        """
+        if self._pending:
+            traces, rows = zip(*self._pending)
+            self._require_fig().add_traces(list(traces), rows=list(rows), cols=[1] * len(rows))
+            self._pending.clear()
+        return self
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _hovertemplate(hover_name: Optional[str], hover_units: Optional[str]) -> str:
+        """Build the hover template for a line; cached since the same few combinations repeat per figure."""
+        hovertemplate = "%{y:.2f}"
+        if hover_units:
+            hovertemplate = hovertemplate + f"{hover_units}"
+        if hover_name:
+            hovertemplate = f"{hover_name}<br>" + hovertemplate
+        return hovertemplate
+
+    @staticmethod
+    def _as_datetime_array(x: Union[pd.Series, Iterable]) -> np.ndarray:
+        """
+        Convert x to a naive datetime64 array that Plotly serializes without boxing each value.
+        Timezone-aware input is reduced to its wall time, which is what Plotly.js displays anyway.
+        """
+        x_idx = pd.DatetimeIndex(pd.to_datetime(x))
+        if x_idx.tz is not None:
+            x_idx = x_idx.tz_localize(None)
+        return x_idx.to_numpy()
 
     # -------------------------------
     # Layout / panels
@@ -70,6 +132,7 @@ class BasePlot:
         else:
             assert abs(sum(row_heights) - 1.0) < 1e-6, "row_heights must sum to 1"
 
+        self._pending.clear()
         self.fig = make_subplots(
             rows=rows,
             cols=1,
@@ -165,36 +228,39 @@ class BasePlot:
         hover_units: Optional[str] = None,
         color: Optional[str] = None,
         legendgroup: Optional[str] = None,
+        webgl: bool = True,
+        defer: bool = False,
     ) -> "BasePlot":
         """
         Add a line (optionally with markers) to a given panel row (1-indexed).
+        webgl=True draws the line with go.Scattergl, which stays responsive for long series.
+        Hover templates work the same for both renderers.
+        defer=True collects the trace until flush() is called.
         """
-        assert self.fig is not None, "Call create_base() first."
+        fig = self._require_fig()
 
         mode = "lines+markers" if markers else "lines"
-        hovertemplate = "%{y:.2f}"
-        if hover_units:
-            hovertemplate = hovertemplate + f"{hover_units}"
-        if hover_name:
-            hovertemplate = f"{hover_name}<br>" + hovertemplate
+        hovertemplate = self._hovertemplate(hover_name, hover_units)
 
-        # normalize x to plain datetimes so JSON serialization works
-        x_vals = pd.to_datetime(x).to_pydatetime().tolist()
+        # normalize x to a datetime64 array so JSON serialization works
+        x_vals = self._as_datetime_array(x)
         # mimic Plotly's colorway assignment so we can reuse the color for overlays
-        trace_color = color or self.colorway[len(self.fig.data) % len(self.colorway)]
+        trace_color = color or self._next_color(fig)
         legendgroup = legendgroup or name
-        self.fig.add_trace(
-            go.Scatter(
+        trace_cls = go.Scattergl if webgl else go.Scatter
+        self._add_trace(
+            fig,
+            trace_cls(
                 x=x_vals,
-                y=list(y),
+                y=np.asarray(y),
                 name=name,
                 mode=mode,
                 legendgroup=legendgroup,
                 line=dict(color=trace_color, width=width, dash=dash) if dash else dict(color=trace_color, width=width),
                 hovertemplate=hovertemplate,
             ),
-            row=row,
-            col=1,
+            row,
+            defer,
         )
         if name:
             self._trace_colors[name] = trace_color
@@ -216,29 +282,33 @@ class BasePlot:
         legendgroup: Optional[str] = None,
         opacity: float = 0.95,
         show_in_legend: bool = False,
+        defer: bool = False,
     ) -> "BasePlot":
         """
         Plot markers on an existing line for the positions where `mask` is truthy.
         This is useful for highlighting precipitation/irrigation days on the main panel.
+        defer=True collects the trace until flush() is called.
         """
-        assert self.fig is not None, "Call create_base() first."
+        fig = self._require_fig()
 
-        x_series = pd.Series(pd.to_datetime(x))
-        y_series = pd.Series(y).reset_index(drop=True)
-        mask_series = pd.Series(mask).fillna(False).astype(bool).reset_index(drop=True)
+        x_arr = self._as_datetime_array(x)
+        y_arr = np.asarray(y)
+        event_mask = np.asarray(mask)
+        if event_mask.dtype != bool:
+            # missing values (NaN, None, pd.NA) count as "no event"
+            event_mask = pd.Series(mask).fillna(False).to_numpy(dtype=bool)
 
-        if len(x_series) != len(y_series) or len(x_series) != len(mask_series):
+        if not (x_arr.shape == y_arr.shape == event_mask.shape):
             raise ValueError("x, y, and mask must have the same length for event markers.")
 
-        event_mask = mask_series
         if not event_mask.any():
             return self
 
-        x_markers = x_series[event_mask].dt.to_pydatetime().tolist()
-        y_markers = y_series[event_mask].tolist()
+        x_markers = x_arr[event_mask]
+        y_markers = y_arr[event_mask]
         legendgroup = legendgroup or name
         # Prefer the color of the corresponding line if known
-        trace_color = color or (name and self._trace_colors.get(name)) or self.colorway[len(self.fig.data) % len(self.colorway)]
+        trace_color = color or (name and self._trace_colors.get(name)) or self._next_color(fig)
 
         # hovertemplate = "%{x}<br>%{y}"
         # if hover_units:
@@ -246,7 +316,8 @@ class BasePlot:
         # if hover_name:
         #     hovertemplate = f"{hover_name}<br>" + hovertemplate
 
-        self.fig.add_trace(
+        self._add_trace(
+            fig,
             go.Scatter(
                 x=x_markers,
                 y=y_markers,
@@ -264,8 +335,8 @@ class BasePlot:
                 # hovertemplate=hovertemplate,
                 showlegend=show_in_legend and bool(name),
             ),
-            row=row,
-            col=1,
+            row,
+            defer,
         )
         return self
 
@@ -273,8 +344,7 @@ class BasePlot:
         self, waterbalance_data: pd.DataFrame, field_name: str, precip_limit: Number = 5, **kwargs
         ):
         
-        if self.fig is None:
-            raise ValueError("Figure not initialized. Call create_base() before plotting.")
+        self._require_fig()
         if waterbalance_data is None or waterbalance_data.empty:
             logger.warning("waterbalance_data is empty; nothing to plot.")
             return
@@ -298,7 +368,8 @@ class BasePlot:
         wb["irrigation"] = wb["irrigation"].fillna(0.0)
         wb["precipitation"] = wb["precipitation"].fillna(0.0)
 
-        self.plot_line(wb.index, wb["soil_storage"], name=field_name, **kwargs)
+        # collect the line and its markers and add them to the figure together
+        self.plot_line(wb.index, wb["soil_storage"], name=field_name, defer=True, **kwargs)
         
         self.plot_event_markers(
             wb.index,
@@ -309,6 +380,7 @@ class BasePlot:
             # hover_name="Irrigation",
             # hover_units="mm",
             show_in_legend=False,
+            defer=True,
         )
         
         self.plot_event_markers(
@@ -320,9 +392,10 @@ class BasePlot:
             # hover_name="Precipitation",
             # hover_units="mm",
             show_in_legend=False,
+            defer=True,
         )
 
-        return self
+        return self.flush()
 
 if __name__ == '__main__':
     # app.py
@@ -347,7 +420,7 @@ if __name__ == '__main__':
     bp.plot_line(idx, soil_T, name="Soil Temp 25cm (°C)", dash="dash")
     bp.plot_line(idx, et_mm, name="ET (mm)", markers=True)
     bp.plot_irrigation_events(irrig_times, irrig_mm, row=2, name="Irrigation (mm)")
-    bp.fig.write_html("debug_plot.html")
+    bp.fig.write_html("debug_plot.html", include_plotlyjs="cdn", include_mathjax=False, validate=False)
     # bp.fig.show()
 
     print('App finished')
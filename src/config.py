@@ -1,16 +1,56 @@
 import yaml
 
+import copy
 import logging
+import logging.config
+import os
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError: # pyyaml built without libyaml
+    from yaml import SafeLoader as _Loader
 
 logger = logging.getLogger(__name__)
 
+# Parsed configs keyed by (path, mtime_ns) so unchanged files are only parsed once per process
+_CACHE: dict[tuple[str, int], dict] = {}
+_LOGGING_CONFIGURED = False
+
 
 def load_config(config_file: str):
 
     try:
-        with open(config_file, 'r') as file:
-            config = yaml.safe_load(file)
-        return config
+        key = (os.path.abspath(config_file), os.stat(config_file).st_mtime_ns)
+        if key not in _CACHE:
+            with open(config_file, 'r') as file:
+                config = yaml.load(file, Loader=_Loader)
+            invalidate_config(config_file)
+            _CACHE[key] = config
+        # Hand out a copy so callers cannot alter the cached config
+        return copy.deepcopy(_CACHE[key])
     except Exception as e:
         logger.error(f"Error reading config file: {e}")
         raise
+
+
+def invalidate_config(config_file: str | None = None):
+    """
+    Drop cached configs for config_file, or all cached configs if no file is given.
+    """
+    if config_file is None:
+        _CACHE.clear()
+        return
+    path = os.path.abspath(config_file)
+    for key in [k for k in _CACHE if k[0] == path]:
+        del _CACHE[key]
+
+
+def setup_logging(logging_config: dict):
+    """
+    Apply the logging config once per process; repeated calls (e.g. on reload) keep the existing handlers.
+    """
+    global _LOGGING_CONFIGURED
+    if _LOGGING_CONFIGURED:
+        return
+    logging.config.dictConfig(logging_config)
+    _LOGGING_CONFIGURED = True
@@ -1,24 +1,84 @@
 import datetime
 import logging
 from contextlib import contextmanager
-from typing import Generator, List, Optional, Tuple
+from typing import Generator, Iterator, List, Optional, Tuple
 
-from sqlalchemy import create_engine
+from sqlalchemy import Row, create_engine, delete, event, func, insert, lambda_stmt, make_url, select, text, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm import Session, contains_eager, joinedload, raiseload, sessionmaker
 import pandas as pd
 
 from . import models
 
 logger = logging.getLogger(__name__)
 
+# Dialects with a native multi-row upsert statement
+_NATIVE_UPSERT_DIALECTS = ("sqlite", "postgresql", "mysql", "mariadb")
+
+# WAL lets readers run alongside the writer and, with synchronous=NORMAL, avoids an fsync per commit
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA foreign_keys=ON",
+)
+
+# Water balance dataframe columns persisted by add_water_balance
+_WB_REQUIRED_COLS = (
+    'field_id',
+    'precipitation',
+    'irrigation',
+    'evapotranspiration',
+    'incoming',
+    'net',
+    'soil_storage',
+    'field_capacity',
+    'deficit',
+)
+_WB_OPTIONAL_COLS = ('readily_available_water', 'below_raw')
+_WB_VALUE_COLS = _WB_REQUIRED_COLS + _WB_OPTIONAL_COLS
+_WB_KNOWN_COLS = frozenset(_WB_VALUE_COLS)
+_WB_RECORD_KEYS = ("date",) + _WB_VALUE_COLS
+_WB_UPDATE_COLS = tuple(col for col in _WB_VALUE_COLS if col != "field_id")
+
+
+def _year_bounds(year: int) -> tuple[datetime.date, datetime.date]:
+    """Return the [start, end) dates of a calendar year."""
+    return datetime.date(year, 1, 1), datetime.date(year + 1, 1, 1)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 
 class IrrigDB:
     def __init__(self, path: str = 'sqlite:///database.db', **engine_kwargs) -> None:
         """
         Create a database engine and initialise ORM metadata.
+        Engine defaults below can be overridden through engine_kwargs (e.g. the database section of the config).
         """
+        # Keep compiled statements for the whole process; the query set is small and repetitive
+        engine_kwargs.setdefault("query_cache_size", 1200)
+        if make_url(path).get_backend_name() == "sqlite":
+            # Connections are local and long-lived, so skip the liveness check on every checkout
+            engine_kwargs.setdefault("pool_pre_ping", False)
+        else:
+            # Reuse the most recent connection so idle overflow connections time out and close
+            engine_kwargs.setdefault("pool_use_lifo", True)
+            engine_kwargs.setdefault("pool_pre_ping", True)
+            engine_kwargs.setdefault("pool_recycle", 1800)
         self.engine = create_engine(path, future=True, **engine_kwargs)
+        if self.engine.dialect.name == "sqlite":
+            event.listen(self.engine, "connect", _set_sqlite_pragmas)
         models.Base.metadata.create_all(self.engine)
         self._session_factory = sessionmaker(
             bind=self.engine,
@@ -27,6 +87,12 @@ class IrrigDB:
             expire_on_commit=False,
             future=True,
         )
+        # Water balance upsert built once; executed with a list of records in add_water_balance
+        self._wb_upsert_stmt = (
+            self._water_balance_upsert() if self.engine.dialect.name in _NATIVE_UPSERT_DIALECTS else None
+        )
+        # field name -> id, filled by add_field or on first lookup and invalidated in delete_field
+        self._field_ids: dict[str, int] = {}
 
     @contextmanager
     def session_scope(self) -> Generator[Session, None, None]:
@@ -43,6 +109,9 @@ class IrrigDB:
         finally:
             session.close()
 
+    # The small lookups below are built with lambda_stmt: the statement is constructed and its
+    # cache key computed once per code location; later calls only rebind the closure values.
+
     def _query_field(self, session: Session, name: str | None = None, id: int | None = None) -> Optional[models.Field]:
 
         if name is None and id is None:
@@ -50,82 +119,128 @@ class IrrigDB:
         if name is not None and id is not None:
             raise ValueError('Cannot query field when both id and name are provided')
 
-        if name is not None:
-            return (
-                session.query(models.Field)
-                .filter(models.Field.name == name)
-                .one_or_none()
-            )
-        elif id is not None:
-            return (
-                session.query(models.Field)
-                .filter(models.Field.id == id)
-                .one_or_none()
-            )
+        if name is None:
+            # Identity map first; only hits the database if the field is not loaded in this session
+            return session.get(models.Field, id)
+        stmt = lambda_stmt(lambda: select(models.Field).where(models.Field.name == name))
+        return session.execute(stmt).scalar_one_or_none()
+
+    def _get_field_id(self, session: Session, name: str) -> Optional[int]:
+        field_id = self._field_ids.get(name)
+        if field_id is None:
+            field_id = session.execute(
+                lambda_stmt(lambda: select(models.Field.id).where(models.Field.name == name))
+            ).scalar_one_or_none()
+            if field_id is not None:
+                self._field_ids[name] = field_id
+        return field_id
+
+    def _warn_if_unknown_field(self, session: Session, field_name: str | None, action: str):
+        """
+        Called when a query filtered by field name came back empty: tell an unknown name apart from a field without rows.
+        """
+        if field_name is not None and self._get_field_id(session, field_name) is None:
+            logger.warning("Field %s does not exist. Cannot query %s", field_name, action)
+
+    def _get_field_ids(self, session: Session, names) -> dict[str, int]:
+        """
+        Resolve several field names at once; names missing from the cache are fetched in one query.
+        Unknown names are left out of the result.
+        """
+        missing = [name for name in names if name not in self._field_ids]
+        if missing:
+            rows = session.execute(
+                select(models.Field.name, models.Field.id).where(models.Field.name.in_(missing))
+            ).all()
+            self._field_ids.update(dict(rows))
+        return {name: self._field_ids[name] for name in names if name in self._field_ids}
 
     def _get_field_by_id(self, session: Session, id: int) -> Optional[models.Field]:
-        return (
-            session.query(models.Field)
-            .filter(models.Field.id == id)
-            .one_or_none()
-        )
+        return session.get(models.Field, id)
 
     def _get_latest_water_balance(
         self, session: Session, field_id: int
     ) -> Optional[models.WaterBalance]:
-        return (
-            session.query(models.WaterBalance)
-            .filter(models.WaterBalance.field_id == field_id)
+        stmt = lambda_stmt(
+            lambda: select(models.WaterBalance)
+            .where(models.WaterBalance.field_id == field_id)
             .order_by(models.WaterBalance.date.desc())
             .limit(1)
-            .one_or_none()
         )
+        return session.execute(stmt).scalar_one_or_none()
 
     def _get_first_irrigation_event(
         self, session: Session, field_id: int, year: int
     ) -> Optional[models.Irrigation]:
-        return (
-            session.query(models.Irrigation)
-            .filter(models.Irrigation.field_id == field_id)
-            .filter(models.Irrigation.date >= datetime.date(year, 1, 1), models.Irrigation.date < datetime.date(year+1, 1, 1))
+        start, end = _year_bounds(year)
+        stmt = lambda_stmt(
+            lambda: select(models.Irrigation)
+            .where(models.Irrigation.field_id == field_id)
+            .where(models.Irrigation.date >= start, models.Irrigation.date < end)
             .order_by(models.Irrigation.date.asc())
             .limit(1)
-            .one_or_none()
         )
+        return session.execute(stmt).scalar_one_or_none()
 
     def _get_irrigation_events(
-        self, session: Session, field_id: int | None = None, date: datetime.date | None = None, year: int | None = None
-    ) -> Optional[models.Irrigation]:
+        self, session: Session, field_id: int | None = None, date: datetime.date | None = None, year: int | None = None,
+        load_field: bool = False, field_name: str | None = None
+    ) -> List[models.Irrigation]:
 
         if date is not None and year is not None:
             logger.warning("Both date and year passed to query_irrigation_events. Ignoring year")
             year = None
 
-        query = session.query(models.Irrigation)
+        stmt = select(models.Irrigation)
+        if field_name is not None:
+            # Filter through the join on the unique name index instead of resolving the id in a separate query
+            stmt = stmt.join(models.Irrigation.field).where(models.Field.name == field_name)
+            if load_field:
+                stmt = stmt.options(contains_eager(models.Irrigation.field))
+        elif load_field:
+            # Many-to-one, so a join in the same query; event.field stays usable after the session closes
+            stmt = stmt.options(joinedload(models.Irrigation.field))
         if field_id is not None:
-            query = query.filter(models.Irrigation.field_id == field_id)
+            stmt = stmt.where(models.Irrigation.field_id == field_id)
 
         if date is not None:
-            query = query.filter(models.Irrigation.date == date)
+            stmt = stmt.where(models.Irrigation.date == date)
 
         if year is not None:
-            query = query.filter(models.Irrigation.date >= datetime.date(year, 1, 1), models.Irrigation.date < datetime.date(year+1, 1, 1))
+            start, end = _year_bounds(year)
+            stmt = stmt.where(models.Irrigation.date >= start, models.Irrigation.date < end)
 
-        return query.all()
+        return session.execute(stmt).scalars().all()
 
 
-    def get_all_fields(self) -> List[str]:
+    def get_all_fields(self) -> List[models.Field]:
         """
-        Return the distinct field names sorted alphabetically.
+        Return all fields as ORM objects sorted by name. Relationships are not loaded; use the dedicated queries.
         """
         with self.session_scope() as session:
-            fields = (
-                session.query(models.Field)
-                .order_by(models.Field.name)
-                .all()
-            )
+            fields = session.execute(
+                select(models.Field).options(raiseload("*")).order_by(models.Field.name)
+            ).scalars().all()
         return fields
 
+    def get_field_names(self) -> List[str]:
+        """
+        Return the field names sorted alphabetically, without loading the Field objects.
+        """
+        with self.session_scope() as session:
+            return session.execute(
+                select(models.Field.name).order_by(models.Field.name)
+            ).scalars().all()
+
+    def get_field_refs(self) -> List[Row]:
+        """
+        Return (id, name) rows sorted by name, for callers that only need to list or link fields.
+        """
+        with self.session_scope() as session:
+            return session.execute(
+                select(models.Field.id, models.Field.name).order_by(models.Field.name)
+            ).all()
+
     def query_field(self, name: str | None = None, id: int | None = None) -> Optional[models.Field]:
         """
         Retrieve a field by its unique name or its id.
@@ -159,61 +274,56 @@ class IrrigDB:
         area_ha_value = float(area_ha) if area_ha is not None else None
         p_allowable_value = float(p_allowable) if p_allowable is not None else 0
 
+        values = {
+            "reference_station": reference_station,
+            "soil_type": soil_type,
+            "humus_pct": humus_pct,
+            "root_depth_cm": root_depth_cm,
+            "area_ha": area_ha_value,
+            "p_allowable": p_allowable_value,
+        }
+
         updated = False
         try:
+            # The commit at the end of the scope inserts new fields and populates their id
             with self.session_scope() as session:
                 field = self._query_field(session, name = name)
 
                 if field is None:
                     logger.debug("Adding new field %s to database", name)
-                    field = models.Field(
-                        name=name,
-                        reference_station=reference_station,
-                        soil_type=soil_type,
-                        humus_pct=humus_pct,
-                        root_depth_cm=root_depth_cm,
-                        area_ha=area_ha_value,
-                        p_allowable=p_allowable_value,
-                    )
+                    field = models.Field(name=name, **values)
                     session.add(field)
                 else:
-                    if field.reference_station != reference_station:
-                        field.reference_station = reference_station
-                        updated = True
-                    if field.soil_type != soil_type:
-                        field.soil_type = soil_type
-                        updated = True
-                    if field.humus_pct != humus_pct:
-                        field.humus_pct = humus_pct
-                        updated = True
-                    if field.root_depth_cm != root_depth_cm:
-                        field.root_depth_cm = root_depth_cm
-                        updated = True
-                    if field.area_ha != area_ha_value:
-                        field.area_ha = area_ha_value
-                        updated = True
-                    if field.p_allowable != p_allowable_value:
-                        field.p_allowable = p_allowable_value
-                        updated = True
+                    changed = {key: value for key, value in values.items() if getattr(field, key) != value}
+                    updated = bool(changed)
 
                     if not updated:
                         logger.debug("No changes for field %s; skipping update", name)
+                        self._field_ids[name] = field.id
                         return (field, updated)
                     else:
+                        # Single UPDATE for the changed columns; the ORM syncs the loaded instance
+                        session.execute(
+                            update(models.Field)
+                            .where(models.Field.id == field.id)
+                            .values(**changed)
+                        )
                         logger.info(f"Updated field {field.name}. Deleting existing water-balance cache")
                         deleted = self._clear_water_balance(session, field_id = field.id)
 
-                session.flush()  # ensure primary key is populated for new records
-                return (field, updated)
+            self._field_ids[name] = field.id
+            return (field, updated)
         except Exception:
+            self._field_ids.pop(name, None)
             logger.exception("Failed to persist field %s", name)
             return (None, updated)
 
     def query_irrigation_events(
         self, field_name: str | None = None, date: datetime.date | None = None, year: int | None = None
-    ) -> Optional[models.Irrigation]:
+    ) -> List[models.Irrigation]:
         """
-        Retrieve an irrigation event by field name and (optional) date.
+        Retrieve irrigation events, optionally filtered by field name, date or year.
+        An unknown field name yields an empty list and a warning.
         """
         if date is not None and isinstance(date, datetime.datetime):
             raise NotImplementedError(
@@ -221,19 +331,38 @@ class IrrigDB:
             )
 
         with self.session_scope() as session:
-            if field_name is not None:
-                field = self._query_field(session, name = field_name)
-                if field is None:
-                    logger.warning(
-                        "Field %s does not exist. Cannot query irrigation event",
-                        field_name,
-                    )
-                    return None
-                field_id = field.id
-            else:
-                field_id = None
+            field_id = self._field_ids.get(field_name) if field_name is not None else None
+            if field_id is not None:
+                return self._get_irrigation_events(session, field_id, date, year, load_field=True)
+            events = self._get_irrigation_events(session, None, date, year, load_field=True, field_name=field_name)
+            if not events:
+                self._warn_if_unknown_field(session, field_name, "irrigation event")
+            return events
+
+    def query_irrigation_events_bulk(
+        self, field_names: list[str], year: int | None = None
+    ) -> dict[str, list[models.Irrigation]]:
+        """
+        Retrieve the irrigation events of several fields in a single query, keyed by field name.
+        Fields without events map to an empty list.
+        """
+        events = {name: [] for name in field_names}
+        if not events:
+            return events
+
+        with self.session_scope() as session:
+            stmt = (
+                select(models.Field.name, models.Irrigation)
+                .join(models.Irrigation.field)
+                .where(models.Field.name.in_(events.keys()))
+            )
+            if year is not None:
+                start, end = _year_bounds(year)
+                stmt = stmt.where(models.Irrigation.date >= start, models.Irrigation.date < end)
 
-            return self._get_irrigation_events(session, field_id, date, year)
+            for name, event in session.execute(stmt.order_by(models.Irrigation.date)).all():
+                events[name].append(event)
+        return events
 
     def add_irrigation_event(
         self,
@@ -248,10 +377,26 @@ class IrrigDB:
             date = pd.to_datetime(date).date()
 
         with self.session_scope() as session:
-            field = self._query_field(session, name = field_name)
-            if field is None:
+            field_id = self._get_field_id(session, field_name)
+            if field_id is None:
                 raise ValueError(f"Field '{field_name}' not found")
 
+            # Without an ID, insert or update the event for this field/date in one statement
+            if id is None and self.engine.dialect.name == "sqlite":
+                stmt = sqlite_insert(models.Irrigation).values(
+                    field_id=field_id, date=date, method=method, amount=amount
+                )
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[models.Irrigation.field_id, models.Irrigation.date],
+                    set_={"method": stmt.excluded.method, "amount": stmt.excluded.amount},
+                ).returning(models.Irrigation)
+                event = session.scalars(
+                    stmt, execution_options={"populate_existing": True}
+                ).one()
+                logger.debug("Upserted irrigation event %s", event.id)
+                self._clear_water_balance(session, field_id = field_id)
+                return event
+
             # Logic: If ID is provided, update that specific row.
             # If no ID, try to find by date/field (legacy logic) or create new.
             event = None
@@ -263,35 +408,122 @@ class IrrigDB:
             
             # If no ID provided, check if one exists for this date/field (prevent duplicates)
             if event is None:
-                existing = self._get_irrigation_events(session, field.id, date)
+                existing = self._get_irrigation_events(session, field_id, date)
                 if existing:
                     event = existing[0]
             old_field_id = event.field_id if event else None
 
             if event:
                 logger.debug("Updating irrigation event %s", event.id)
-                event.field_id = field.id 
+                event.field_id = field_id
                 event.date = date
                 event.method = method
                 event.amount = amount
             else:
                 logger.debug("Creating new irrigation event")
                 event = models.Irrigation(
-                    field_id=field.id,
+                    field_id=field_id,
                     date=date,
                     method=method,
                     amount=amount,
                 )
                 session.add(event)
 
-            self._clear_water_balance(session, field_id = field.id)
-            if old_field_id and old_field_id != field.id:
-                self._clear_water_balance(session, field_id=old_field_id)
+            # Moving an event to another field invalidates both fields in one DELETE
+            self._clear_water_balances(session, {field_id, old_field_id} - {None})
+
+        # the commit populates the primary key; expire_on_commit=False keeps the instance usable without a refresh
+        return event
 
-            session.flush()
-            # Refresh to ensure we have the ID available if we need to return it
-            session.refresh(event) 
-            return event
+    def add_irrigation_events(self, events: list[dict]) -> int:
+        """
+        Insert or update several irrigation events in a single transaction.
+        Each event is a dict with field_name, date, method and optionally amount. An existing event
+        for the same field and date is updated. Returns the number of events written.
+        """
+        if not events:
+            return 0
+
+        with self.session_scope() as session:
+            field_ids = self._get_field_ids(session, {event["field_name"] for event in events})
+            records = []
+            for event in events:
+                field_id = field_ids.get(event["field_name"])
+                if field_id is None:
+                    raise ValueError(f"Field '{event['field_name']}' not found")
+                date = event["date"]
+                if isinstance(date, str):
+                    date = pd.to_datetime(date).date()
+                records.append(
+                    {
+                        "field_id": field_id,
+                        "date": date,
+                        "method": event["method"],
+                        "amount": event.get("amount", 100),
+                    }
+                )
+
+            if self.engine.dialect.name == "sqlite":
+                # Four parameters per row; stay below sqlite's limit of 999
+                for i in range(0, len(records), 240):
+                    stmt = sqlite_insert(models.Irrigation).values(records[i:i + 240])
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=[models.Irrigation.field_id, models.Irrigation.date],
+                        set_={"method": stmt.excluded.method, "amount": stmt.excluded.amount},
+                    )
+                    session.execute(stmt)
+            else:
+                for record in records:
+                    existing = self._get_irrigation_events(session, record["field_id"], record["date"])
+                    if existing:
+                        existing[0].method = record["method"]
+                        existing[0].amount = record["amount"]
+                    else:
+                        session.add(models.Irrigation(**record))
+
+            # One DELETE for all touched fields instead of one per field
+            self._clear_water_balances(session, {record["field_id"] for record in records})
+
+            return len(records)
+
+    def _water_balance_stmt(
+        self,
+        field_name: str | None = None,
+        field_id: int | None = None,
+        start: datetime.date | None = None,
+        end: datetime.date | None = None,
+        columns: list[str] | None = None,
+    ):
+        """
+        Build the water balance SELECT. An unknown field_name yields a statement without rows;
+        callers warn about it once the result turns out empty.
+        With columns, only those columns are selected instead of WaterBalance objects.
+        """
+        if field_name is not None and field_id is not None:
+            raise ValueError("Cannot specify both field_name and field_id")
+
+        if columns is not None:
+            stmt = select(*(getattr(models.WaterBalance, col) for col in columns))
+        else:
+            # Rows are read column-wise only; fail loudly instead of lazy-loading WaterBalance.field per row
+            stmt = select(models.WaterBalance).options(raiseload("*"))
+
+        if field_name is not None:
+            field_id = self._field_ids.get(field_name)
+            if field_id is None:
+                # Resolve the name in the same query rather than with a separate lookup
+                stmt = stmt.join(models.WaterBalance.field).where(models.Field.name == field_name)
+
+        if field_id is not None:
+            stmt = stmt.where(models.WaterBalance.field_id == field_id)
+
+        if start is not None:
+            stmt = stmt.where(models.WaterBalance.date >= start)
+
+        if end is not None:
+            stmt = stmt.where(models.WaterBalance.date <= end)
+
+        return stmt
 
     def query_water_balance(
         self, 
@@ -301,29 +533,54 @@ class IrrigDB:
         end: datetime.date | None = None
         ):
 
-        if field_name is not None and field_id is not None:
-            raise ValueError("Cannot specify both field_name and field_id")
-        
         with self.session_scope() as session:
-            query = session.query(models.WaterBalance)
-
-            if field_name is not None:
-                field = self._query_field(session, name = field_name)
-                if field is None:
-                    logger.warning("Field %s does not exist. Cannot query water balance", field_name)
-                    return []
-                query = query.filter(models.WaterBalance.field_id == field.id)
-
-            if field_id is not None:
-                query = query.filter(models.WaterBalance.field_id == field_id)
-
-            if start is not None:
-                query = query.filter(models.WaterBalance.date >= start)
+            stmt = self._water_balance_stmt(field_name, field_id, start, end)
+            rows = session.execute(stmt).scalars().all()
+            if not rows:
+                self._warn_if_unknown_field(session, field_name, "water balance")
+            return rows
 
-            if end is not None:
-                query = query.filter(models.WaterBalance.date <= end)
+    def query_water_balance_df(
+        self,
+        field_name: str | None = None,
+        field_id: int | None = None,
+        start: datetime.date | None = None,
+        end: datetime.date | None = None,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Return water balance entries as a dataframe with one column per selected attribute (all by default).
+        Rows are read as plain tuples, skipping ORM object construction.
+        """
+        columns = list(columns) if columns is not None else [col.name for col in models.WaterBalance.__table__.columns]
+        with self.session_scope() as session:
+            stmt = self._water_balance_stmt(field_name, field_id, start, end, columns=columns)
+            rows = session.execute(stmt).all()
+            if not rows:
+                self._warn_if_unknown_field(session, field_name, "water balance")
+        return pd.DataFrame.from_records(rows, columns=columns)
 
-            return query.all()
+    def query_water_balance_iter(
+        self,
+        field_name: str | None = None,
+        field_id: int | None = None,
+        start: datetime.date | None = None,
+        end: datetime.date | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[List[models.WaterBalance]]:
+        """
+        Stream water balance entries in lists of up to batch_size rows, for scans too large to load at once.
+        The session stays open until the iterator is exhausted or closed.
+        """
+        with self.session_scope() as session:
+            stmt = self._water_balance_stmt(field_name, field_id, start, end)
+            result = session.execute(stmt.execution_options(yield_per=batch_size))
+            empty = True
+            for partition in result.scalars().partitions():
+                empty = False
+                yield partition
+            if empty:
+                self._warn_if_unknown_field(session, field_name, "water balance")
 
     def latest_water_balance(self, field_id: int) -> Optional[models.WaterBalance]:
         """
@@ -332,6 +589,47 @@ class IrrigDB:
         with self.session_scope() as session:
             return self._get_latest_water_balance(session, field_id)
 
+    def latest_water_balance_bulk(self, field_ids: list[int]) -> dict[int, models.WaterBalance]:
+        """
+        Return the latest water balance entry of several fields in a single query, keyed by field id.
+        Fields without entries are left out.
+        """
+        if not field_ids:
+            return {}
+
+        # Greatest date per field joined back to its row; portable where LATERAL is not (sqlite)
+        latest = (
+            select(models.WaterBalance.field_id, func.max(models.WaterBalance.date).label("date"))
+            .where(models.WaterBalance.field_id.in_(field_ids))
+            .group_by(models.WaterBalance.field_id)
+            .subquery()
+        )
+        stmt = select(models.WaterBalance).join(
+            latest,
+            (models.WaterBalance.field_id == latest.c.field_id) & (models.WaterBalance.date == latest.c.date),
+        )
+        with self.session_scope() as session:
+            return {wb.field_id: wb for wb in session.execute(stmt).scalars()}
+
+    def data_version(self) -> tuple:
+        """
+        Cheap fingerprint of the irrigation and water balance tables. It changes whenever events are
+        added, edited or deleted (each of which also clears water balance rows) or the water balance is rewritten.
+        """
+        irrigation = select(
+            func.count(models.Irrigation.id),
+            func.max(models.Irrigation.id),
+            func.max(models.Irrigation.date),
+            func.sum(models.Irrigation.amount),
+        )
+        water_balance = select(
+            func.count(),
+            func.max(models.WaterBalance.date),
+            func.sum(models.WaterBalance.soil_storage),
+        ).select_from(models.WaterBalance)
+        with self.session_scope() as session:
+            return tuple(session.execute(irrigation).one()) + tuple(session.execute(water_balance).one())
+
     def first_irrigation_event(self, field_id: int, year: int):
         with self.session_scope() as session:
             return self._get_first_irrigation_event(session, field_id, year)
@@ -341,24 +639,11 @@ class IrrigDB:
         Upsert water balance records from a dataframe.
         Returns the number of rows inserted/updated.
         """
-        df = water_balance.copy()
-        if field_id is not None:
-            df["field_id"] = field_id
-
-        required_cols = [
-            'field_id',
-            'precipitation',
-            'irrigation',
-            'evapotranspiration',
-            'incoming',
-            'net',
-            'soil_storage',
-            'field_capacity',
-            'deficit',
-        ]
-        optional_cols = ['readily_available_water', 'below_raw']
+        # field_id overrides the column when given; it is filled in per record below, so the frame is never copied
+        df = water_balance
+        provided = set(df.columns) | ({"field_id"} if field_id is not None else set())
 
-        missing_required = [col for col in required_cols if col not in df.columns]
+        missing_required = [col for col in _WB_REQUIRED_COLS if col not in provided]
         if missing_required:
             logger.warning(
                 "Not all required columns to save the water balance are present. Missing: %s. "
@@ -375,61 +660,86 @@ class IrrigDB:
             )
             return 0
 
-        for col in optional_cols:
-            if col not in df.columns:
-                df[col] = None
-
-        extra_cols = [col for col in df.columns if col not in required_cols + optional_cols]
+        extra_cols = [col for col in df.columns if col not in _WB_KNOWN_COLS]
         if extra_cols:
             logger.info(
                 "Additional columns %s will be ignored when saving the water balance.",
                 ", ".join(extra_cols),
             )
 
-        df = df.rename_axis("date").reset_index()
-        # Ensure the series is in UTC before extracting the date
-        if df["date"].dt.tz is not None:
-            # If it's timezone-aware, convert to UTC
-            df["date"] = df["date"].dt.tz_convert("UTC")
-        else:
-            # If it's naive, assume it's UTC
-            df["date"] = df["date"].dt.tz_localize("UTC")
-        df["date"] = pd.to_datetime(df["date"]).dt.date
-        df = df[["date"] + required_cols + optional_cols]
+        # Dates are stored as UTC calendar days; a naive index is assumed to be UTC already
+        index = df.index.tz_convert("UTC") if df.index.tz is not None else df.index
+        values = [index.date] + [
+            [field_id] * len(df) if col == "field_id" and field_id is not None
+            else df[col].tolist() if col in df.columns
+            else [None] * len(df)
+            for col in _WB_VALUE_COLS
+        ]
 
-        records = df.to_dict(orient="records")
+        # zip rows against a single key list instead of to_dict(orient="records"), which boxes every cell first
+        records = [dict(zip(_WB_RECORD_KEYS, row)) for row in zip(*values)]
         if not records:
             logger.info("Water balance dataframe is empty. Nothing to persist.")
             return 0
 
-        # Use SQLite upsert for performance; fall back to per-row merge for other dialects.
-        if self.engine.dialect.name == "sqlite":
-            stmt = sqlite_insert(models.WaterBalance).values(records)
-            update_cols = {
-                col: getattr(stmt.excluded, col)
-                for col in required_cols + optional_cols
-                if col not in ("field_id", "date")
-            }
-            stmt = stmt.on_conflict_do_update(
-                index_elements=[models.WaterBalance.field_id, models.WaterBalance.date],
-                set_=update_cols,
-            )
-
+        if self._wb_upsert_stmt is not None:
+            # One cached statement run as executemany; no per-call compile and no bound parameter limit
             with self.session_scope() as session:
-                result = session.execute(stmt)
-                return result.rowcount or 0
+                session.execute(self._wb_upsert_stmt, records)
+            return len(records)
+
+        # Generic fallback: replace the affected rows and insert them with one executemany
+        dates_by_field: dict[int, list[datetime.date]] = {}
+        for record in records:
+            dates_by_field.setdefault(record["field_id"], []).append(record["date"])
 
         with self.session_scope() as session:
-            for record in records:
-                session.merge(models.WaterBalance(**record))
+            for wb_field_id, dates in dates_by_field.items():
+                session.execute(
+                    delete(models.WaterBalance).where(
+                        models.WaterBalance.field_id == wb_field_id,
+                        models.WaterBalance.date.in_(dates),
+                    )
+                )
+            session.execute(insert(models.WaterBalance), records)
             return len(records)
 
+    def _water_balance_upsert(self):
+        """
+        Build the dialect's native upsert (ON CONFLICT / ON DUPLICATE KEY) for water balance rows,
+        to be executed with a list of records. Only valid for dialects in _NATIVE_UPSERT_DIALECTS.
+        """
+        dialect = self.engine.dialect.name
+        if dialect in ("mysql", "mariadb"):
+            stmt = mysql_insert(models.WaterBalance)
+            return stmt.on_duplicate_key_update({col: stmt.inserted[col] for col in _WB_UPDATE_COLS})
+
+        insert_fn = sqlite_insert if dialect == "sqlite" else pg_insert
+        stmt = insert_fn(models.WaterBalance)
+        return stmt.on_conflict_do_update(
+            index_elements=[models.WaterBalance.field_id, models.WaterBalance.date],
+            set_={col: getattr(stmt.excluded, col) for col in _WB_UPDATE_COLS},
+        )
+
     def _clear_water_balance(self, session: Session, field_id: int):
-        query = session.query(models.WaterBalance).filter(models.WaterBalance.field_id == field_id)
-        deleted = query.delete(synchronize_session=False)
+        deleted = session.execute(
+            delete(models.WaterBalance).where(models.WaterBalance.field_id == field_id)
+        ).rowcount
         logger.info(f"Cleared {deleted} water balance rows for field {field_id}")
         return deleted
 
+    def _clear_water_balances(self, session: Session, field_ids) -> int:
+        field_ids = list(field_ids)
+        deleted_total = 0
+        # Stay below sqlite's default limit of 999 bound parameters per statement
+        for i in range(0, len(field_ids), 900):
+            chunk = field_ids[i:i + 900]
+            deleted_total += session.execute(
+                delete(models.WaterBalance).where(models.WaterBalance.field_id.in_(chunk))
+            ).rowcount
+        logger.info(f"Cleared {deleted_total} water balance rows for fields {field_ids}")
+        return deleted_total
+
     def clear_water_balance(self, field_ids: list[int] | None = None) -> int:
         """
         Delete water balance entries. If field_ids provided, only delete those.
@@ -438,20 +748,20 @@ class IrrigDB:
 
         if field_ids is None:
             with self.session_scope() as session:
-                query = session.query(models.WaterBalance)
-                deleted = query.delete(synchronize_session=False)
+                if self.engine.dialect.name == "postgresql":
+                    # TRUNCATE skips per-row MVCC work but reports no rowcount, so count first
+                    deleted = session.execute(select(func.count()).select_from(models.WaterBalance)).scalar_one()
+                    session.execute(text(f"TRUNCATE TABLE {models.WaterBalance.__tablename__}"))
+                else:
+                    deleted = session.execute(delete(models.WaterBalance)).rowcount
                 logger.info(f"Cleared entire water balance cache: {deleted} rows.")
                 return deleted
 
         if isinstance(field_ids, int):
             field_ids = [field_ids]
 
-        deleted_total = 0
-        for field_id in field_ids:
-            with self.session_scope() as session:
-                deleted = self._clear_water_balance(session, field_id)
-                deleted_total += deleted
-        return deleted_total
+        with self.session_scope() as session:
+            return self._clear_water_balances(session, field_ids)
 
     def delete_field(self, field_id: int) -> bool:
         with self.session_scope() as session:
@@ -459,6 +769,7 @@ class IrrigDB:
             if not field:
                 return False
             session.delete(field)
+            self._field_ids.pop(field.name, None)
             return True
 
     def delete_irrigation_event(self, event_id: int) -> bool:
@@ -492,15 +803,14 @@ if __name__ == '__main__':
 
     fields = db.get_all_fields()
 
-    for date in pd.date_range("04-01-2025", "10-01-2025", freq = "2W"):
-        for field in fields:
-            db.add_irrigation_event(
-                field_name=field.name,
-                date=date.date(),
-                method='drip',
-            )
+    events = [
+        {"field_name": field.name, "date": date.date(), "method": 'drip'}
+        for date in pd.date_range("04-01-2025", "10-01-2025", freq = "2W")
+        for field in fields
+    ]
+    db.add_irrigation_events(events)
 
     print('Fields in database:')
-    print(db.get_all_fields())
+    print(db.get_field_names())
 
     db.close()
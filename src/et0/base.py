@@ -1,26 +1,48 @@
 from abc import ABC, abstractmethod
+from types import MappingProxyType
+from typing import Mapping
+
+_REGISTRY: dict[str, type["ET0Calculator"]] = {}
 
 class ET0Calculator(ABC):
     """
     Base class for ET0 (reference evapotranspiration) calculation.
     """
 
-    registry: dict[str, type["ET0Calculator"]] = {}
+    # Read-only view; calculators register themselves on subclassing
+    registry: Mapping[str, type["ET0Calculator"]] = MappingProxyType(_REGISTRY)
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
         if not getattr(cls, "__abstractmethods__", None):
-            ET0Calculator.registry[cls.name()] = cls
+            name = cls.name()
+            existing = _REGISTRY.get(name)
+            # A reloaded module re-registers the same class; a different class under the same name is a bug
+            if existing is not None and (existing.__module__, existing.__qualname__) != (cls.__module__, cls.__qualname__):
+                raise ValueError(f"ET0 calculator name '{name}' is already used by {existing.__qualname__}")
+            _REGISTRY[name] = cls
 
     @classmethod
     @abstractmethod
     def name(cls):
-        pass    
+        pass
 
     @abstractmethod
-    def calculate(self, data):
+    def calculate(self, station, correct: bool = True):
         pass
 
-    def get_calculator_by_name(name):
-        return ET0Calculator.registry.get(name)
+    def calculate_many(self, stations: Mapping[str, object], correct: bool = True) -> dict[str, object]:
+        """
+        Run calculate once per station and return the results keyed like `stations`.
+        Fields sharing a reference station can then reuse one result instead of recomputing it.
+        Stations that are None are skipped.
+        """
+        return {
+            key: self.calculate(station, correct=correct)
+            for key, station in stations.items()
+            if station is not None
+        }
 
+    @staticmethod
+    def get_calculator_by_name(name):
+        return _REGISTRY.get(name)
@@ -1,6 +1,7 @@
 from pyet import pm_fao56
 import pandas as pd
 
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 import logging
 
@@ -14,8 +15,21 @@ logger = logging.getLogger(__name__)
 
 class PenmanDailyCalculator(ET0Calculator):
 
-    def __init__(self, corrector: "ETCorrection | None" = None, **kwargs):
+    def __init__(
+        self,
+        corrector: "ETCorrection | None" = None,
+        cache_enabled: bool = True,
+        cache_size: int = 32,
+        **kwargs,
+    ):
         self.corrector = corrector
+        self.cache_enabled = cache_enabled
+        self.cache_size = cache_size
+        # Uncorrected ET0 keyed by (station id, first timestamp, last timestamp, length), least recently used first
+        self._et_cache: OrderedDict[tuple, pd.DataFrame] = OrderedDict()
+
+    def clear_cache(self):
+        self._et_cache.clear()
 
     @classmethod
     def name(cls):
@@ -27,9 +41,11 @@ class PenmanDailyCalculator(ET0Calculator):
                 f"Index of input data has to be of type datetime. Got {data.index.dtype}"
             )
 
-        freq = None
+        # Indexes built by date_range or resample carry their freq; only scan the index when it is unset
+        freq = data.index.freqstr
         try:
-            freq = pd.infer_freq(data.index)
+            if freq is None:
+                freq = pd.infer_freq(data.index)
         except Exception as e:
             logger.warning(
                 "Failed to determine input datetime frequency for PenmanDailyCalculator "
@@ -44,6 +60,28 @@ class PenmanDailyCalculator(ET0Calculator):
         if correct and self.corrector is None:
             raise ValueError('Correct set to true but no corrector available.')
 
+        meteo_data = station.data
+        key = None
+        if self.cache_enabled and not meteo_data.empty:
+            key = (station.id, meteo_data.index[0], meteo_data.index[-1], len(meteo_data))
+
+        et = self._et_cache.get(key) if key is not None else None
+        if et is None:
+            et = self._pm_fao56(station)
+            if key is not None:
+                self._et_cache[key] = et
+                if len(self._et_cache) > self.cache_size:
+                    self._et_cache.popitem(last=False)
+        else:
+            self._et_cache.move_to_end(key)
+
+        # Hand out a copy so callers cannot alter the cached result; apply_to shares blocks with its input
+        et = et.copy()
+        if correct:
+            return self.corrector.apply_to(et, "et0")
+        return et
+
+    def _pm_fao56(self, station: "Station") -> pd.DataFrame:
         meteo_data = station.data
         self._validate_data(meteo_data)
 
@@ -59,9 +97,4 @@ class PenmanDailyCalculator(ET0Calculator):
             )
 
         et.name = 'et0'
-        et = et.to_frame()
-        
-        if correct:
-            et = self.corrector.apply_to(et, "et0")
-
-        return et
+        return et.to_frame()
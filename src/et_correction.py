@@ -1,9 +1,13 @@
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from datetime import datetime, date, timedelta
 from typing import Mapping, Sequence
 
+import numpy as np
 import pandas as pd
 
+# pandas < 3 copies on concat unless told otherwise; from 3.0 copy-on-write makes it lazy and the keyword is deprecated
+_CONCAT_NO_COPY = {"copy": False} if int(pd.__version__.split(".")[0]) < 3 else {}
 
 @dataclass(frozen=True)
 class KcPeriod:
@@ -38,12 +42,19 @@ class ETCorrection:
         normalized = [p if isinstance(p, KcPeriod) else KcPeriod.from_spec(p) for p in periods]
         normalized.sort(key=lambda p: p.start)
 
-        self._periods = self._attach_end_dates(normalized, season_end)
+        # One array per column, used directly by the lookups
+        self._names, self._values, self._starts, self._ends = self._attach_end_dates(normalized, season_end)
+        # Naive starts as int64 ns; compared against wall-clock times so no per-call tz_localize is needed
+        self._starts_ns = self._starts.as_unit("ns").asi8
+        # Daily curves keyed by (start, end, tz); apply_to on frames of the same period reuses them
+        self._daily_cached = lru_cache(maxsize=8)(self._daily_series_in_tz)
 
-    @property
+    @cached_property
     def dataframe(self) -> pd.DataFrame:
         """Tabular view of the correction periods."""
-        return pd.DataFrame(self._periods)
+        return pd.DataFrame(
+            {"name": self._names, "value": self._values, "start": self._starts, "end": self._ends}
+        )
 
     def as_daily_series(
         self,
@@ -52,20 +63,21 @@ class ETCorrection:
     ) -> pd.Series:
         """Return a daily step series spanning [start, end)."""
 
-        frame = self.dataframe
+        start_ts = pd.Timestamp(start) if start else self._starts.min().normalize()
+        end_ts = pd.Timestamp(end) if end else self._ends.max().normalize()
 
-        start_ts = pd.Timestamp(start) if start else frame["start"].min().normalize()
-        end_ts = pd.Timestamp(end) if end else frame["end"].max().normalize()
+        daily_index = pd.date_range(start_ts, end_ts, freq="D")
+        wall_clock = daily_index.tz_localize(None) if daily_index.tz is not None else daily_index
 
-        if start_ts.tzinfo is not None:
-            frame['start'] = frame['start'].dt.tz_localize(start_ts.tzinfo)
-            frame['end'] = frame['end'].dt.tz_localize(start_ts.tzinfo)
+        # Periods are sorted by start: one binary search finds the period active on each day
+        pos = np.searchsorted(self._starts_ns, wall_clock.as_unit("ns").asi8, side="right") - 1
+        kc = np.where(pos >= 0, self._values[pos.clip(0)], np.nan)
 
-        daily_index = pd.date_range(start_ts, end_ts, freq="D")
-        step_points = frame.set_index("start")["value"]
-        kc = step_points.reindex(daily_index, method="pad").rename("kc")
+        return pd.Series(kc, index=daily_index, name="kc")
 
-        return kc
+    def _daily_series_in_tz(self, start: pd.Timestamp, end: pd.Timestamp, tz: str) -> pd.Series:
+        # Timestamps of the same instant hash equal across timezones, so tz must be part of the cache key
+        return self.as_daily_series(start, end)
 
     def as_dayofyear_series(
         self, start: int, end: int, anchor_year: int
@@ -86,10 +98,16 @@ class ETCorrection:
         """Align correction factors to any monotonic index."""
         
         if isinstance(target_index, pd.DatetimeIndex):
-            daily = self.as_daily_series(target_index.min().normalize(), target_index.max().normalize())
+            if target_index.is_monotonic_increasing:
+                first, last = target_index[0], target_index[-1]
+            else:
+                first, last = target_index.min(), target_index.max()
+            daily = self._daily_cached(first.normalize(), last.normalize(), str(target_index.tz))
             return daily.reindex(target_index, method="pad").rename("kc")
         elif isinstance(target_index, pd.RangeIndex):
-            doy_series = self.as_dayofyear_series(target_index.min(), target_index.max(), anchor_year)
+            # A range knows its bounds, no need to scan it
+            first, last = sorted((target_index[0], target_index[-1]))
+            doy_series = self.as_dayofyear_series(first, last, anchor_year)
             return doy_series.reindex(target_index, method="pad").rename("kc")
 
         raise TypeError("target_index must be a pandas DatetimeIndex or RangeIndex.")
@@ -99,22 +117,30 @@ class ETCorrection:
     ) -> pd.DataFrame:
         """Multiply ET0 values in `column` by the correction curve."""
 
-        kc = self.to_series(frame.index)
-        corrected = frame.copy()
-        corrected["kc"] = kc
-        corrected[f"{column}_corrected"] = corrected[column] * kc
-
-        return corrected
+        kc = self.to_series(frame.index).to_numpy()
+        # kc is built on frame.index, so plain arrays skip the alignment
+        added = pd.DataFrame(
+            {"kc": kc, f"{column}_corrected": frame[column].to_numpy() * kc},
+            index=frame.index,
+        )
+        replaced = frame.columns.intersection(added.columns)
+        if len(replaced):
+            # Overwrite in place like plain column assignment did, keeping the original column order
+            order = list(frame.columns) + [col for col in added.columns if col not in replaced]
+            corrected = pd.concat([frame.drop(columns=replaced), added], axis=1, **_CONCAT_NO_COPY)
+            return corrected.reindex(columns=order)
+        # Attach the new columns next to the existing blocks instead of copying the input frame
+        return pd.concat([frame, added], axis=1, **_CONCAT_NO_COPY)
 
     @staticmethod
     def _attach_end_dates(
         periods: Sequence[KcPeriod],
         season_end: datetime | str | None,
-    ) -> list[dict[str, object]]:
+    ) -> tuple[np.ndarray, np.ndarray, pd.DatetimeIndex, pd.DatetimeIndex]:
 
         season_end_ts = pd.to_datetime(season_end, dayfirst = True) if season_end else None
 
-        resolved: list[dict[str, object]] = []
+        names, values, starts, ends = [], [], [], []
         for idx, period in enumerate(periods):
             next_start = periods[idx + 1].start if idx + 1 < len(periods) else None
             end = period.end or next_start or season_end_ts
@@ -122,15 +148,16 @@ class ETCorrection:
             if end is None:
                 end = period.start.replace(day = 31, month = 12)
 
-            resolved.append(
-                {
-                    "name": period.name,
-                    "value": period.value,
-                    "start": period.start,
-                    "end": pd.Timestamp(end),
-                }
-            ) #store as dict to facilitate transformation to dataframe
-        return resolved
+            names.append(period.name)
+            values.append(period.value)
+            starts.append(period.start)
+            ends.append(pd.Timestamp(end))
+        return (
+            np.asarray(names, dtype=object),
+            np.asarray(values, dtype=np.float64),
+            pd.DatetimeIndex(starts),
+            pd.DatetimeIndex(ends),
+        )
 
 if __name__ == '__main__':
     periods = [
@@ -1,10 +1,60 @@
+import numpy as np
 import pandas as pd
 
 from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping
 
 from .database.models import Field
 from .irrigation import FieldIrrigation
 
+# Standard-Lookup: Bodenart -> nFK-Bereich (mm/dm)
+_DEFAULT_NFK_LOOKUP: Mapping[str, tuple[float, float]] = MappingProxyType({
+    # sehr sandig
+    "sand": (6, 12),
+    "schwach lehmiger sand": (8, 14),
+    "lehmiger sand": (12, 18),
+    "schluffiger sand": (10, 16),
+    # schluff/loam
+    "sandiger schluff": (20, 28),
+    "schluff": (22, 30),
+    "lehm": (18, 25),
+    "sandiger lehm": (16, 22),
+    "schluffiger lehm": (20, 28),
+    # tonig
+    "toniger lehm": (18, 26),
+    "schluffiger ton": (18, 25),
+    "ton": (15, 22),
+    # organisch angereichert
+    "humoser lehmiger sand": (14, 20)
+})
+# Mittelwert je Bodenart, einmal beim Import berechnet
+_DEFAULT_BASE_MM_PER_DM: Mapping[str, float] = MappingProxyType(
+    {soil: (nfk_min + nfk_max) / 2.0 for soil, (nfk_min, nfk_max) in _DEFAULT_NFK_LOOKUP.items()}
+)
+
+def _clamped_cumsum(net: np.ndarray, capacity: float, initial: float) -> np.ndarray:
+    """
+    Running sum of net clamped to [0, capacity] after every step, starting from initial.
+    Until the storage first leaves [0, capacity] this is a plain cumsum; from there on each step
+    depends on the previous clamp, so the rest runs as a loop over Python floats.
+    """
+    out = initial + np.cumsum(net)
+    outside = (out < 0.0) | ~(out <= capacity) # ~(<=) also catches NaN, like min(capacity, nan) did
+    if not outside.any():
+        return out
+
+    first = int(np.argmax(outside))
+    current = out[first - 1] if first > 0 else initial
+    for i, delta in enumerate(net[first:].tolist(), start=first):
+        current = current + delta
+        if not current <= capacity:
+            current = capacity
+        elif current < 0.0:
+            current = 0.0
+        out[i] = current
+    return out
+
 @dataclass
 class FieldCapacity:
     soil_type: str
@@ -30,6 +80,7 @@ class FieldHandler:
         self.name = field.name
         self.reference_station = field.reference_station
         self.soil_type = field.soil_type
+        self._soil_type_lower = field.soil_type.lower()
         self.humus_pct = field.humus_pct
         self.area_ha = field.area_ha
         self.root_depth_cm = field.root_depth_cm
@@ -68,38 +119,18 @@ class FieldHandler:
             ValueError: bei unplausiblen Eingaben.
         """
 
-        # Standard-Lookup
-        default_lookup: dict[str, tuple[float, float]] = {
-            # sehr sandig
-            "sand": (6, 12),
-            "schwach lehmiger sand": (8, 14),
-            "lehmiger sand": (12, 18),
-            "schluffiger sand": (10, 16),
-            # schluff/loam
-            "sandiger schluff": (20, 28),
-            "schluff": (22, 30),
-            "lehm": (18, 25),
-            "sandiger lehm": (16, 22),
-            "schluffiger lehm": (20, 28),
-            # tonig
-            "toniger lehm": (18, 26),
-            "schluffiger ton": (18, 25),
-            "ton": (15, 22),
-            # organisch angereichert
-            "humoser lehmiger sand": (14, 20)
-        }
-
-        lookup = custom_lookup or default_lookup
-
-        if self.soil_type.lower() not in lookup:
+        if custom_lookup:
+            nfk_range = custom_lookup.get(self._soil_type_lower)
+            base_mm_per_dm = (nfk_range[0] + nfk_range[1]) / 2.0 if nfk_range is not None else None
+        else:
+            base_mm_per_dm = _DEFAULT_BASE_MM_PER_DM.get(self._soil_type_lower)
+
+        if base_mm_per_dm is None:
             raise KeyError(
                 f"Bodenart '{self.soil_type}' not found in Lookup table. "
                 "Use 'custom_lookup' argument or add to default table in FieldHandler."
             )
 
-        nfk_min, nfk_max = lookup[self.soil_type.lower()]
-        base_mm_per_dm = (nfk_min + nfk_max) / 2.0
-
         # Humus-Aufschlag: +1.5 mm/dm je 1% über 1.5%, max +6 mm/dm
         humus_extra = max(0.0, self.humus_pct - 1.5) * 1.5
         humus_extra = min(humus_extra, 6.0)
@@ -138,7 +169,8 @@ class FieldHandler:
         if self.field_capacity is None:
             raise ValueError("Field capacity unknown. Call get_field_capacity() beforehand.")
 
-        data = station_data.sort_index().copy()
+        # Only read from below, so no copy; sort only when the index is not already ordered
+        data = station_data if station_data.index.is_monotonic_increasing else station_data.sort_index()
 
         if "precipitation" not in data.columns:
             raise KeyError("Station data must contain a 'precipitation' column.")
@@ -147,24 +179,22 @@ class FieldHandler:
         if et_column is None:
             raise KeyError("Station data must contain either 'et0_corrected' or 'et0'.")
 
-        precip = data["precipitation"].fillna(0.0)
-        evap = data[et_column].fillna(0.0)
+        # All inputs share data.index, so the arithmetic runs on plain arrays without index alignment
+        precip = data["precipitation"].fillna(0.0).to_numpy(dtype=np.float64)
+        evap = data[et_column].fillna(0.0).to_numpy(dtype=np.float64)
 
         if field_irrigation is None:
-            irrigation = pd.Series(0.0, index=data.index)
+            irrigation = np.zeros(len(data.index))
         else:
-            irrigation = field_irrigation.to_dataframe(data.index, fill_value = 0.0)
+            irrigation = field_irrigation.to_dataframe(data.index, fill_value = 0.0).to_numpy(dtype=np.float64)
 
         incoming = precip + irrigation
         net = incoming - evap
 
         capacity = self.field_capacity.nfk_total_mm
 
-        storage = []
         current_storage = capacity if initial_storage is None else max(0.0, min(capacity, initial_storage))
-        for delta in net:
-            current_storage = max(0.0, min(capacity, current_storage + delta))
-            storage.append(current_storage)
+        storage = _clamped_cumsum(net, float(capacity), float(current_storage))
 
         water_balance = pd.DataFrame(
             {
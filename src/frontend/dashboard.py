@@ -1,5 +1,10 @@
 import asyncio
+import datetime
+import hashlib
+import json
 import logging
+import os
+from pathlib import Path
 import pandas as pd
 from nicegui import ui
 from ..config import load_config
@@ -10,7 +15,39 @@ from .header import add_header
 
 logger = logging.getLogger(__name__)
 _fig_cache = None
+_fig_dict: dict | None = None # plain-dict form of _fig_cache, rebuilt together with it
+_fig_mtime: int | None = None # config mtime the cached figure was built from
 _build_lock = asyncio.Lock()
+_FIG_CACHE_DIR = Path('.cache')
+
+def _config_mtime() -> int:
+    return os.stat('config/config.yaml').st_mtime_ns
+
+def _fig_cache_path() -> Path:
+    """
+    Disk location of the serialized figure for the current config, day and database contents, so a restart
+    can serve the last figure instead of re-running the whole workflow. Must run off the event loop (queries the db).
+    """
+    data_version = get_db().data_version()
+    key = hashlib.sha1(
+        f"{_config_mtime()}:{datetime.date.today().isoformat()}:{data_version}".encode()
+    ).hexdigest()[:16]
+    return _FIG_CACHE_DIR / f"waterbalance_{key}.json"
+
+def _write_fig_cache(fig):
+    path = _fig_cache_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    for stale in path.parent.glob('waterbalance_*.json'):
+        stale.unlink(missing_ok=True)
+    tmp = path.with_suffix('.tmp')
+    tmp.write_text(fig.to_json())
+    tmp.replace(path)
+
+def _read_fig_cache() -> dict | None:
+    path = _fig_cache_path()
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())
 
 def build_waterbalance_fig():
     # Use a context manager if your IrrigDB supports it to ensure connection closure
@@ -28,21 +65,54 @@ def build_waterbalance_fig():
     )
     return fig
 
+def _drop_stale_fig():
+    """Forget the in-memory figure once the config it was built from has changed."""
+    global _fig_cache, _fig_dict, _fig_mtime
+    mtime = _config_mtime()
+    if _fig_mtime != mtime:
+        _fig_cache = _fig_dict = None
+        _fig_mtime = mtime
+
 async def get_fig(force: bool = False):
-    global _fig_cache
+    global _fig_cache, _fig_dict, _fig_mtime
+    _drop_stale_fig()
     if _fig_cache is not None and not force:
         return _fig_cache
 
     async with _build_lock:
         if _fig_cache is not None and not force:
             return _fig_cache
-        _fig_cache = await asyncio.to_thread(build_waterbalance_fig)
+        mtime = _config_mtime()
+        fig = await asyncio.to_thread(build_waterbalance_fig)
+        # Build the dict form once per rebuild instead of once per page load; ui.plotly still encodes it per client
+        _fig_dict = await asyncio.to_thread(fig.to_plotly_json)
+        _fig_cache = fig
+        _fig_mtime = mtime
+        try:
+            await asyncio.to_thread(_write_fig_cache, fig)
+        except Exception as e:
+            logger.warning(f"Could not write the dashboard figure cache: {e}")
         return _fig_cache
 
+async def get_fig_dict(force: bool = False) -> dict:
+    """Return the cached figure as a plain dict, so ui.plotly does not convert the figure object on each page load."""
+    global _fig_dict
+    _drop_stale_fig()
+    if _fig_dict is None and not force:
+        try:
+            _fig_dict = await asyncio.to_thread(_read_fig_cache)
+        except Exception as e:
+            logger.warning(f"Could not read the dashboard figure cache: {e}")
+        if _fig_dict is not None:
+            return _fig_dict
+    await get_fig(force=force)
+    return _fig_dict
+
 async def get_latest_water_balance(fields, db):
     data = []
+    latest = db.latest_water_balance_bulk([field.id for field in fields])
     for field in fields:
-        wb_field = db.latest_water_balance(field.id)
+        wb_field = latest.get(field.id)
         if wb_field:
             data.append({
                 'Anlage': field.name,
@@ -60,7 +130,7 @@ async def render_dashboard_content(db, fields, force: bool = False):
 
     # Run the heavy tasks
     df_task = get_latest_water_balance(fields, db)
-    fig_task = get_fig(force=force)
+    fig_task = get_fig_dict(force=force)
     
     df_balance, fig = await asyncio.gather(df_task, fig_task)
     
@@ -82,7 +152,7 @@ async def render_dashboard_content(db, fields, force: bool = False):
 async def dashboard():
     add_header()
     db = get_db()
-    fields = db.get_all_fields()
+    fields = db.get_field_refs()
     
     with ui.column().classes("w-full max-w-5xl mx-auto q-pa-md gap-6"):
         # Header Section (Static)
@@ -11,7 +11,7 @@ def irrigation_page():
 
     # 1. Fetch Field Options for the Dropdown
     # We need a list of names like ['Field A', 'Field B']
-    all_fields = db.get_all_fields() # Returns objects
+    all_fields = db.get_field_refs() # Returns (id, name) rows
     field_options = [f.name for f in all_fields]
     # Create a lookup map {id: name} for the table display
     id_to_name = {f.id: f.name for f in all_fields}
@@ -67,13 +67,14 @@ def irrigation_page():
             # Create new entries for everything
             remaining_fields = fields
 
-        # Loop through remaining and Create New (ID=None)
+        # Create New (ID=None) for the remaining fields in one transaction
+        entries = []
         for f in remaining_fields:
-            # We must clear the ID so DB creates a new row
             entry_data = kwargs.copy()
-            entry_data['id'] = None 
+            entry_data.pop('id', None)
             entry_data['field_name'] = f
-            db.add_irrigation_event(**entry_data)
+            entries.append(entry_data)
+        db.add_irrigation_events(entries)
 
     IRRIGATION_SCHEMA = [
         {'name': 'field_name', 'label': 'Anlage', 'type': 'select', 'options': field_options, 'required': True, 'multiple': True},
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 from datetime import datetime
@@ -66,7 +67,11 @@ class FieldIrrigation:
         elif irr_df.index.tz is not None:
             irr_df.index = irr_df.index.tz_localize(None)
 
-        daily = irr_df['amount'].fillna(0.0).groupby(irr_df.index.normalize()).sum()
-        aligned = daily.reindex(index.normalize(), fill_value=fill_value)
-        aligned.index = index
-        return aligned.astype(float)
\ No newline at end of file
+        daily = irr_df['amount'].fillna(0.0).resample('D').sum(min_count=1).dropna()
+
+        # Both sides are midnight bins in the same tz, so a binary search on the int64 values aligns them
+        bins = daily.index.as_unit('ns').asi8
+        days = index.normalize().as_unit('ns').asi8
+        pos = bins.searchsorted(days).clip(max=len(bins) - 1)
+        values = np.where(bins[pos] == days, daily.to_numpy(dtype=float)[pos], fill_value)
+        return pd.Series(values, index=index, name='amount', dtype=float)
\ No newline at end of file
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Sequence
+import threading
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional, Tuple, Any
 from dataclasses import dataclass
@@ -57,7 +59,12 @@ class MeteoHandler:
         self.query_template = api_config["query_template"].lstrip("/")
 
         self.et0_calculator = et0_calculator
-        self._session = requests.Session()
+        # requests.Session is not thread-safe; query_many workers each get their own
+        self._local = threading.local()
+        # Fallback radiation shared by query_many workers: fetched once for the span of all windows,
+        # on first need. Structure: {"start": Timestamp, "end": Timestamp, "fetched": bool, "data": DataFrame | None}
+        self._radiation_shared: dict[str, Any] | None = None
+        self._radiation_lock = threading.Lock()
 
         # Cache keyed by station_id with coverage window to avoid refetching.
         # Structure: {station_id: {"station": Station, "start": Timestamp, "end": Timestamp, "metadata": dict}}
@@ -72,6 +79,19 @@ class MeteoHandler:
             return ts.tz_localize("UTC")
         return ts.tz_convert("UTC")
 
+    @property
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+
+    @classmethod
+    def _parse_timestamp(cls, value: datetime | str) -> pd.Timestamp:
+        if isinstance(value, str):
+            value = pd.to_datetime(value, dayfirst=True)
+        return cls._to_utc(pd.to_datetime(value))
+
     @staticmethod
     def _margin_from_resampler(resampler: MeteoResampler | None) -> pd.Timedelta:
         """
@@ -207,12 +227,16 @@ class MeteoHandler:
         if not self.radiation_fallback_station:
             return df
 
-        fallback_df, _ = self._get_data(
-            self.radiation_fallback_provider,
-            self.radiation_fallback_station,
-            start,
-            end,
-        )
+        shared_df = self._shared_fallback_radiation(start, end)
+        if shared_df is not None:
+            fallback_df = shared_df.loc[(shared_df.index >= start) & (shared_df.index < end)]
+        else:
+            fallback_df, _ = self._get_data(
+                self.radiation_fallback_provider,
+                self.radiation_fallback_station,
+                start,
+                end,
+            )
 
         if fallback_df.empty or "solar_radiation" not in fallback_df.columns:
             logger.warning(
@@ -236,6 +260,28 @@ class MeteoHandler:
         df["solar_radiation"] = fallback_series
         return df
 
+    def _shared_fallback_radiation(self, start: datetime, end: datetime) -> Optional[pd.DataFrame]:
+        """
+        Return the fallback radiation shared by the running query_many call if it covers [start, end).
+        The first caller fetches it; a failed or empty fetch returns None so callers fetch their own window.
+        """
+        shared = self._radiation_shared
+        if shared is None or start < shared["start"] or end > shared["end"]:
+            return None
+
+        with self._radiation_lock:
+            if not shared["fetched"]:
+                fallback_df, _ = self._get_data(
+                    self.radiation_fallback_provider,
+                    self.radiation_fallback_station,
+                    shared["start"],
+                    shared["end"],
+                )
+                if not fallback_df.empty and isinstance(fallback_df.index, pd.DatetimeIndex):
+                    shared["data"] = fallback_df
+                shared["fetched"] = True
+        return shared["data"]
+
     def query(
             self, 
             provider: str, 
@@ -245,13 +291,8 @@ class MeteoHandler:
             resampler: MeteoResampler | None = None
         ) -> Optional[Station]:
         
-        if isinstance(start, str):
-            start = pd.to_datetime(start, dayfirst=True)
-        if isinstance(end, str):
-            end = pd.to_datetime(end, dayfirst=True)
-
-        start = self._to_utc(pd.to_datetime(start))
-        end = self._to_utc(pd.to_datetime(end))
+        start = self._parse_timestamp(start)
+        end = self._parse_timestamp(end)
 
         if start >= end:
             raise ValueError("start must be before end")
@@ -341,6 +382,41 @@ class MeteoHandler:
             sliced_data,
         )
 
+    def query_many(
+            self,
+            provider: str,
+            windows: Mapping[str, tuple[datetime | str, datetime | str]],
+            resampler: MeteoResampler | None = None,
+            max_workers: int = 8,
+        ) -> dict[str, Optional[Station]]:
+        """
+        Query several stations concurrently. `windows` maps station ids to (start, end) tuples.
+        Network latency overlaps across stations and the results also populate the station cache,
+        so later calls to query() within these windows are served without a request.
+        """
+        if not windows:
+            return {}
+
+        def _fetch_one(item):
+            station_id, (start, end) = item
+            return station_id, self.query(provider, station_id, start, end, resampler=resampler)
+
+        # Stations without radiation all fall back to the same station: share one fetch over the whole span
+        if self.radiation_fallback_station:
+            parsed = [(self._parse_timestamp(start), self._parse_timestamp(end)) for start, end in windows.values()]
+            self._radiation_shared = {
+                "start": min(start for start, _ in parsed),
+                "end": max(end for _, end in parsed),
+                "fetched": False,
+                "data": None,
+            }
+
+        try:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(windows))) as executor:
+                return dict(executor.map(_fetch_one, windows.items()))
+        finally:
+            self._radiation_shared = None
+
     def calculate_et(self, stations, et_calculator, correct: bool = True):
         """
         Adds et0 or et values to the station data, depending on correct.
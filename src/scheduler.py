@@ -28,17 +28,19 @@ class IrrigationScheduler:
                 await self.callback()
             except Exception as e:
                 logger.error(f"Scheduler error: {e}")
-            
+
+            # Recomputed from the wall clock after each run, so a slow callback does not shift the schedule
             sleep_seconds = self._seconds_until_next_run()
-            logger.info(f"Scheduler: Next run in {sleep_seconds}s")
+            logger.info(f"Scheduler: Next run in {sleep_seconds:.0f}s")
             await asyncio.sleep(sleep_seconds)
 
-    def _seconds_until_next_run(self) -> int:
+    def _seconds_until_next_run(self) -> float:
         now = datetime.now()
         next_run = datetime.combine(now.date(), self.time_of_day)
         if next_run <= now:
             next_run = next_run + timedelta(days=1)
-        return int((next_run - now).total_seconds())
+        # Keep sub-second precision; truncating could wake up just before next_run and fire twice
+        return (next_run - now).total_seconds()
 
     @staticmethod
     def _parse_time_of_day(value: str) -> time:
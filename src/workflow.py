@@ -64,19 +64,11 @@ class WaterBalanceWorkflow:
     def _plot_cached_water_balance(self, field, start_date):
         try:
             end_date = (self.season_end_utc - timedelta(days=1)).date()
-            wb_persisted = self.db.query_water_balance(field_id = field.id, start = start_date, end = end_date)
-            if wb_persisted:
-                wb_df = pd.DataFrame(
-                    [
-                        {
-                            "date": rec.date,
-                            "soil_storage": rec.soil_storage,
-                            "irrigation": getattr(rec, "irrigation", 0.0),
-                            "precipitation": getattr(rec, "precipitation", 0.0),
-                        }
-                        for rec in wb_persisted
-                    ]
-                )
+            wb_df = self.db.query_water_balance_df(
+                field_id = field.id, start = start_date, end = end_date,
+                columns = ["date", "soil_storage", "irrigation", "precipitation"],
+            )
+            if not wb_df.empty:
                 wb_df["date"] = pd.to_datetime(wb_df["date"]).dt.tz_localize("UTC")
                 wb_df["irrigation"] = wb_df["irrigation"].fillna(0.0)
                 wb_df["precipitation"] = wb_df["precipitation"].fillna(0.0)
@@ -87,27 +79,69 @@ class WaterBalanceWorkflow:
         except Exception as e:
             logger.error(f"Error plotting cached water balance for field {field.name}: {e}")
 
+    def _plan_field(self, field):
+        """
+        Determine the season start, calculation window and initial storage of a field.
+        Returns None if the field has no irrigation events this year.
+        """
+        field_season_start = self.db.first_irrigation_event(field.id, self.year)
+        if field_season_start is None:
+            logger.info(f"No irrigation events found for field {field.name}. Skipping")
+            return None
+
+        season_start_ts = pd.Timestamp(field_season_start.date, tz="UTC")
+        latest_balance = self.db.latest_water_balance(field.id)
+
+        if latest_balance:
+            next_ts = pd.Timestamp(latest_balance.date, tz="UTC") + timedelta(days=1)
+            start_ts = max(season_start_ts, next_ts)
+            initial_storage = latest_balance.soil_storage
+        else:
+            start_ts = season_start_ts
+            initial_storage = None
+
+        period_end = min(pd.Timestamp.now(tz=self.tz).tz_convert('UTC'), self.season_end_utc)
+        return season_start_ts, start_ts, period_end, initial_storage
+
+    def _prefetch_meteo(self, plans):
+        """
+        Query all reference stations concurrently so the per-field queries are served from the meteo cache.
+        Returns the ET of each prefetched station, computed once over the merged window of its fields.
+        """
+        windows = {}
+        for field, (_, start_ts, period_end, _) in plans:
+            if start_ts >= period_end:
+                continue
+            station_start, station_end = windows.get(field.reference_station, (start_ts, period_end))
+            windows[field.reference_station] = (min(station_start, start_ts), max(station_end, period_end))
+
+        try:
+            stations = self.runtime_context.meteo_handler.query_many(
+                provider="SBR", windows=windows, resampler=self.runtime_context.resampler
+            )
+        except Exception as e:
+            logger.warning(f"Prefetching meteo data failed, stations are queried per field instead: {e}")
+            return {}
+
+        try:
+            return self.runtime_context.et_calculator.calculate_many(stations, correct=True)
+        except Exception as e:
+            logger.warning(f"Computing ET per station failed, ET is computed per field instead: {e}")
+            return {}
+
     def run(self):
 
+        # 1. Setup Time Ranges
+        plans = []
         for field in self.fields:
-            field_season_start = self.db.first_irrigation_event(field.id, self.year)
-            if field_season_start is None:
-                logger.info(f"No irrigation events found for field {field.name}. Skipping")
-                continue
+            plan = self._plan_field(field)
+            if plan is not None:
+                plans.append((field, plan))
 
-            # 1. Setup Time Ranges
-            season_start_ts = pd.Timestamp(field_season_start.date, tz="UTC")
-            latest_balance = self.db.latest_water_balance(field.id)
-            
-            if latest_balance:
-                next_ts = pd.Timestamp(latest_balance.date, tz="UTC") + timedelta(days=1)
-                start_ts = max(season_start_ts, next_ts)
-                initial_storage = latest_balance.soil_storage
-            else:
-                start_ts = season_start_ts
-                initial_storage = None
+        et_by_station = self._prefetch_meteo(plans)
+        events_by_field = self.db.query_irrigation_events_bulk([field.name for field, _ in plans], year=self.year)
 
-            period_end = min(pd.Timestamp.now(tz=self.tz).tz_convert('UTC'), self.season_end_utc)
+        for field, (season_start_ts, start_ts, period_end, initial_storage) in plans:
 
             # 2. Logic Branching
             if start_ts >= period_end:
@@ -129,10 +163,13 @@ class WaterBalanceWorkflow:
                         self._plot_cached_water_balance(field, season_start_ts.date())
                         continue
 
-                    # ET and Balance Calculation
-                    station.data = station.data.join(self.runtime_context.et_calculator.calculate(station, correct=True))
+                    # ET and Balance Calculation; the station-wide ET covers this field's window, join aligns it
+                    et = et_by_station.get(field.reference_station)
+                    if et is None:
+                        et = self.runtime_context.et_calculator.calculate(station, correct=True)
+                    station.data = station.data.join(et)
                     field_capacity = field.get_field_capacity()
-                    field_irrigation = FieldIrrigation.from_list(self.db.query_irrigation_events(field.name, year=self.year))
+                    field_irrigation = FieldIrrigation.from_list(events_by_field.get(field.name, []))
                     field_wb = field.calculate_water_balance(station.data, field_irrigation, initial_storage=initial_storage)
                     
                     # Persist
@@ -147,4 +184,3 @@ class WaterBalanceWorkflow:
                     logger.error(f"Calculation failed for {field.name}: {e}", exc_info=True)
                     # Fallback to whatever history we have
                     self._plot_cached_water_balance(field, season_start_ts.date())
-            
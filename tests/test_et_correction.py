@@ -0,0 +1,22 @@
+import pandas as pd
+
+from src.et_correction import ETCorrection
+
+PERIODS = [
+    {"name": "Kc_ini", "value": 0.5, "start": "01-01-2025"},
+    {"name": "Kc_mid", "value": 0.9, "start": "01-06-2025"},
+]
+
+
+def test_apply_to_does_not_reuse_daily_curve_across_timezones():
+    # Both frames start and end in winter, where UTC and London midnights are the same instant
+    corrector = ETCorrection(PERIODS, season_end="31-12-2025")
+    utc = pd.DataFrame({"et0": 1.0}, index=pd.date_range("2025-01-01", "2025-12-01", tz="UTC"))
+    london = pd.DataFrame({"et0": 1.0}, index=pd.date_range("2025-01-01", "2025-12-01", tz="Europe/London"))
+
+    corrector.apply_to(utc, "et0")
+    kc = corrector.apply_to(london, "et0")["kc"]
+
+    expected = ETCorrection(PERIODS, season_end="31-12-2025").apply_to(london, "et0")["kc"]
+    pd.testing.assert_series_equal(kc, expected)
+    assert kc.loc["2025-06-01":"2025-06-02"].tolist() == [0.9, 0.9]